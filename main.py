@@ -5,18 +5,18 @@ A real-time monitoring application for Advanced Driver Assistance Systems
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QGridLayout, 
-    QGroupBox, QVBoxLayout, QFrame, QGraphicsDropShadowEffect, 
-    QSizePolicy, QSplitter, QHBoxLayout, QPushButton
+    QGroupBox, QVBoxLayout, QFrame,
+    QSizePolicy, QHBoxLayout, QPushButton
 )
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
-from PySide6.QtCore import QUrl, Qt, QTimer
-from PySide6.QtGui import QColor
-from PySide6.QtSvgWidgets import QSvgWidget
+from PySide6.QtCore import (
+    QByteArray, QEvent, QUrl, Qt, QTimer, QSize, QSizeF, QPointF, QRectF
+)
+from PySide6.QtGui import QColor, QPainter, QPalette, QPixmap
 from PySide6.QtSvg import QSvgRenderer
 import random
 import os
-import re
 
 
 class StyleConstants:
@@ -25,6 +25,7 @@ class StyleConstants:
     BG_DARK = "#0b0f12"
     BG_CARD = "#1a1e23"
     BG_FRAME = "#121418"
+    BG_GLOW = "#07262b"
     BORDER_DARK = "#2a3541"
     BORDER_LIGHT = "#3a3e43"
     
@@ -45,6 +46,199 @@ class StyleConstants:
     SEPARATOR_WIDTH = 1
 
 
+# Stylesheets are built once at import time and shared by every widget.
+# Static rules live in one application-wide sheet; only the indicator
+# on/off rules are assigned per widget, on state transitions.
+_CENTRAL_QSS = f"""
+    QWidget#central {{
+        background: {StyleConstants.BG_DARK};
+    }}
+"""
+
+_TITLE_QSS = f"""
+    QLabel#appTitle {{
+        background: {StyleConstants.BG_CARD};
+        color: {StyleConstants.GRAY_LIGHT};
+        font-size: 18px;
+        font-weight: 700;
+        padding: 12px 24px;
+        border-radius: 8px;
+        border: 1px solid {StyleConstants.BORDER_DARK};
+    }}
+"""
+
+_SIDEBAR_QSS = f"""
+    QGroupBox#indicatorSidebar {{
+        color:{StyleConstants.GRAY_LIGHT}; 
+        font-weight:600; 
+        border:none;
+        margin-top:8px;
+    }}
+    QGroupBox#indicatorSidebar::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 0px;
+    }}
+"""
+
+_VIDEO_HEADER_QSS = f"""
+    QFrame#videoHeader {{
+        background: {StyleConstants.BLUE_PRIMARY};
+        border: 1px solid {StyleConstants.BLUE_DARK};
+        border-radius: 6px;
+    }}
+    QFrame#videoHeader QLabel {{
+        color: #ffffff;
+        font-weight: 600;
+        font-size: 13px;
+        background: transparent;
+    }}
+"""
+
+_VIDEO_BODY_QSS = f"""
+    QVideoWidget#videoWidget {{
+        background:#000000;
+    }}
+    QLabel#videoPlaceholder {{
+        color:{StyleConstants.GRAY_MED};
+    }}
+"""
+
+_TOGGLE_BTN_QSS = f"""
+    QPushButton#videoToggle {{
+        background: {StyleConstants.BG_CARD};
+        color: {StyleConstants.GRAY_MED};
+        border: 1px solid {StyleConstants.BORDER_DARK};
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 600;
+        font-size: 13px;
+    }}
+    QPushButton#videoToggle:checked {{
+        background: {StyleConstants.BLUE_PRIMARY};
+        color: #ffffff;
+        border: 1px solid {StyleConstants.BLUE_DARK};
+    }}
+    QPushButton#videoToggle:hover {{
+        background: #253240;
+    }}
+    QPushButton#videoToggle:checked:hover {{
+        background: {StyleConstants.BLUE_DARK};
+    }}
+    QPushButton#videoToggle:pressed {{
+        background: #1e293b;
+    }}
+"""
+
+_GLOBAL_QSS = "".join((
+    _CENTRAL_QSS,
+    _TITLE_QSS,
+    _SIDEBAR_QSS,
+    _VIDEO_HEADER_QSS,
+    _VIDEO_BODY_QSS,
+    _TOGGLE_BTN_QSS,
+))
+
+# Indicator state rules, one sheet per state covering the card and its
+# children so a transition is a single polish pass ("on" tint stands in
+# for a drop-shadow glow, which would blur the card on every repaint)
+_CARD_QSS_ON = f"""
+    QFrame#indicatorCard {{
+        background-color: {StyleConstants.BG_GLOW};
+        border: 4px solid {StyleConstants.CYAN_BRIGHT};
+        border-radius: 18px;
+    }}
+    QFrame#indicatorCard QFrame#iconCircle {{
+        background: transparent;
+        border: 3px solid {StyleConstants.CYAN_BRIGHT};
+        border-radius: 25px;
+    }}
+    QFrame#indicatorCard QLabel#indicatorText {{
+        background: transparent;
+        color:{StyleConstants.CYAN_LIGHT};
+        font-weight:600;
+    }}
+"""
+
+_CARD_QSS_OFF = f"""
+    QFrame#indicatorCard {{
+        background-color: {StyleConstants.BG_DARK};
+        border: 4px solid {StyleConstants.GRAY_DARKER};
+        border-radius: 18px;
+    }}
+    QFrame#indicatorCard QFrame#iconCircle {{
+        background: transparent;
+        border: 3px solid {StyleConstants.GRAY_DARKER};
+        border-radius: 25px;
+    }}
+    QFrame#indicatorCard QLabel#indicatorText {{
+        background: transparent;
+        color:{StyleConstants.GRAY_DARK};
+        font-weight:600;
+    }}
+"""
+
+
+# Raw SVG file contents keyed by path, read once per process
+_SVG_SOURCE: dict[str, bytes] = {}
+
+# Rasterized icons keyed by (svg_path, color, width, height, device pixel ratio)
+_ICON_CACHE: dict[tuple[str, str, int, int, float], QPixmap] = {}
+
+
+def _load_svg(svg_path: str) -> bytes:
+    """Return the SVG source for a path, reading the file only the first time"""
+    source = _SVG_SOURCE.get(svg_path)
+    if source is None:
+        # A missing icon renders as an empty pixmap instead of aborting startup
+        source = b""
+        if os.path.exists(svg_path):
+            with open(svg_path, 'rb') as f:
+                source = f.read()
+        _SVG_SOURCE[svg_path] = source
+    return source
+
+
+def _render_svg(
+    svg_path: str, color: str, ratio: float, size: QSize = QSize(30, 30)
+) -> QPixmap:
+    """Render an SVG once per device pixel ratio into a pixmap tinted with a solid color"""
+    key = (svg_path, color, size.width(), size.height(), ratio)
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is not None:
+        return pixmap
+        
+    pixmap = QPixmap(size * ratio)
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    # Explicit logical bounds: without them QtSvg fills the physical pixmap size
+    bounds = QRectF(QPointF(0, 0), QSizeF(size))
+    QSvgRenderer(QByteArray(_load_svg(svg_path))).render(painter, bounds)
+    # Keep the icon's alpha, replace its color
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(pixmap.rect(), QColor(color))
+    painter.end()
+    
+    _ICON_CACHE[key] = pixmap
+    return pixmap
+
+
+class FastFrame(QFrame):
+    """Opaque, square-cornered solid-color frame painted directly, bypassing style sheets"""
+    
+    def __init__(self, color: str, parent: QWidget = None):
+        super().__init__(parent)
+        self._color = QColor(color)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        
+    def paintEvent(self, event):
+        """Fill the exposed area with the frame color"""
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._color)
+
+
 class MainWindow(QMainWindow):
     """Main application window for ADAS Monitoring System"""
     
@@ -52,14 +246,15 @@ class MainWindow(QMainWindow):
         super().__init__()
         self._setup_window()
         self._create_ui()
-        self._start_indicator_timer()
+        self._setup_indicator_timers()
+        self.showMaximized()
         
     def _setup_window(self):
         """Initialize window properties"""
         self.setWindowTitle("ADAS Monitoring System")
         central = QWidget()
         self.setCentralWidget(central)
-        central.setStyleSheet(f"background:{StyleConstants.BG_DARK};")
+        central.setObjectName("central")
         
         self.grid = QGridLayout(central)
         self.grid.setContentsMargins(16, 16, 16, 16)
@@ -78,32 +273,12 @@ class MainWindow(QMainWindow):
         """Create application title bar"""
         self.title = QLabel("ADAS Monitoring System")
         self.title.setAlignment(Qt.AlignCenter)
-        self.title.setStyleSheet(f"""
-            background: {StyleConstants.BG_CARD};
-            color: {StyleConstants.GRAY_LIGHT};
-            font-size: 18px;
-            font-weight: 700;
-            padding: 12px 24px;
-            border-radius: 8px;
-            border: 1px solid {StyleConstants.BORDER_DARK};
-        """)
+        self.title.setObjectName("appTitle")
         
     def _create_sidebar(self):
         """Create indicator sidebar"""
         self.sidebar = QGroupBox("Indicators")
-        self.sidebar.setStyleSheet(f"""
-            QGroupBox {{
-                color:{StyleConstants.GRAY_LIGHT}; 
-                font-weight:600; 
-                border:none;
-                margin-top:8px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 0px;
-            }}
-        """)
+        self.sidebar.setObjectName("indicatorSidebar")
         
         sidebar_layout = QVBoxLayout(self.sidebar)
         sidebar_layout.setContentsMargins(8, 8, 8, 8)
@@ -130,41 +305,42 @@ class MainWindow(QMainWindow):
         self.video2 = self._make_video_card("Bird's Eyes View", "./videos/BEV.mp4")
         self.video3 = self._make_video_card("Driving Monitoring System", "./videos/DMS.mp4")
         
-        # Right splitter (video2 + video3 vertical)
-        self.right_split = QSplitter(Qt.Vertical)
-        self.right_split.setHandleWidth(6)
-        self.right_split.setChildrenCollapsible(True)
-        self.right_split.addWidget(self.video2)
-        self.right_split.addWidget(self.video3)
-        self.right_split.setStretchFactor(0, 1)
-        self.right_split.setStretchFactor(1, 1)
-        
-        # Main content splitter
-        self.content_split = QSplitter(Qt.Horizontal)
-        self.content_split.setHandleWidth(6)
-        self.content_split.setChildrenCollapsible(True)
-        self.content_split.addWidget(self.video1)
-        self.content_split.addWidget(self.right_split)
-        self.content_split.setStretchFactor(0, 2)
-        self.content_split.setStretchFactor(1, 1)
+        # Right column (video2 over video3)
+        self.right_panel = QWidget()
+        self.right_grid = QGridLayout(self.right_panel)
+        self.right_grid.setContentsMargins(0, 0, 0, 0)
+        self.right_grid.setSpacing(6)
+        self.right_grid.addWidget(self.video2, 0, 0)
+        self.right_grid.addWidget(self.video3, 1, 0)
+        
+        # Main content grid; stretch factors are set by _update_video_visibility
+        self.content_panel = QWidget()
+        self.content_grid = QGridLayout(self.content_panel)
+        self.content_grid.setContentsMargins(0, 0, 0, 0)
+        self.content_grid.setSpacing(6)
+        self.content_grid.addWidget(self.video1, 0, 0)
+        self.content_grid.addWidget(self.right_panel, 0, 1)
         
         # Toggle controls
         control_bar = self._create_control_bar()
         
-        # Container
+        # Container paints one opaque background for the whole video area
         self.content_container = QWidget()
+        palette = self.content_container.palette()
+        palette.setColor(QPalette.Window, QColor(StyleConstants.BG_DARK))
+        self.content_container.setPalette(palette)
+        self.content_container.setAutoFillBackground(True)
         cc = QVBoxLayout(self.content_container)
         cc.setContentsMargins(0, 0, 0, 0)
         cc.setSpacing(6)
         cc.addWidget(control_bar)
-        cc.addWidget(self.content_split)
+        cc.addWidget(self.content_panel)
         cc.setStretch(0, 0)
         cc.setStretch(1, 1)
         
     def _create_control_bar(self):
         """Create video toggle control bar"""
-        control_bar = QFrame()
-        control_bar.setStyleSheet("background: transparent;")
+        control_bar = QWidget()
         cb = QHBoxLayout(control_bar)
         cb.setContentsMargins(0, 0, 0, 8)
         cb.setSpacing(8)
@@ -178,10 +354,11 @@ class MainWindow(QMainWindow):
         cb.addWidget(self.btn_v2)
         cb.addWidget(self.btn_v3)
         
-        # Wire signals
-        self.btn_v1.toggled.connect(self._update_video_visibility)
-        self.btn_v2.toggled.connect(self._update_video_visibility)
-        self.btn_v3.toggled.connect(self._update_video_visibility)
+        # Wire signals through one pre-bound slot
+        self._upd_cb = self._update_video_visibility
+        self.btn_v1.toggled.connect(self._upd_cb, Qt.AutoConnection)
+        self.btn_v2.toggled.connect(self._upd_cb, Qt.AutoConnection)
+        self.btn_v3.toggled.connect(self._upd_cb, Qt.AutoConnection)
         
         return control_bar
         
@@ -191,15 +368,8 @@ class MainWindow(QMainWindow):
         separator_layout = QVBoxLayout(self.separator_container)
         separator_layout.setContentsMargins(0, 0, 0, 0)
         
-        separator = QFrame()
-        separator.setFrameShape(QFrame.VLine)
-        separator.setStyleSheet(f"""
-            QFrame {{
-                background-color: {StyleConstants.BORDER_LIGHT};
-                max-width: {StyleConstants.SEPARATOR_WIDTH}px;
-                min-width: {StyleConstants.SEPARATOR_WIDTH}px;
-            }}
-        """)
+        separator = FastFrame(StyleConstants.BORDER_LIGHT)
+        separator.setFixedWidth(StyleConstants.SEPARATOR_WIDTH)
         
         separator_layout.addStretch(2)
         separator_layout.addWidget(separator, 95)
@@ -222,19 +392,12 @@ class MainWindow(QMainWindow):
         self.grid.setRowStretch(4, 1)
         
         self._update_video_visibility()
-        self.showMaximized()
         
     def _make_indicator_card(self, name: str, svg_path: str) -> QFrame:
         """Create an indicator card with icon and label"""
         card = QFrame()
         card.setObjectName("indicatorCard")
-        card.setStyleSheet(f"""
-            QFrame#indicatorCard {{
-                background-color: {StyleConstants.BG_DARK};
-                border: 4px solid {StyleConstants.CYAN_BRIGHT};
-                border-radius: 18px;
-            }}
-        """)
+        card.setStyleSheet(_CARD_QSS_ON)
         card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         card.setMinimumHeight(StyleConstants.INDICATOR_HEIGHT)
         
@@ -244,32 +407,21 @@ class MainWindow(QMainWindow):
         
         # Icon circle
         circle = self._create_icon_circle(svg_path)
-        icon_container = QWidget()
-        icon_layout = QVBoxLayout(icon_container)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        icon_layout.addWidget(circle, 0, Qt.AlignCenter)
         
         # Label
         text = QLabel(name)
         text.setAlignment(Qt.AlignCenter)
-        text.setStyleSheet(f"color:{StyleConstants.CYAN_LIGHT}; font-weight:600;")
+        text.setObjectName("indicatorText")
         
-        layout.addWidget(icon_container)
+        layout.addWidget(circle, 0, Qt.AlignCenter)
         layout.addWidget(text)
         
-        # Glow effect
-        glow = QGraphicsDropShadowEffect()
-        glow.setBlurRadius(24)
-        glow.setOffset(0, 0)
-        glow.setColor(QColor(StyleConstants.CYAN_BRIGHT))
-        card.setGraphicsEffect(glow)
-        
         # Store references
         card.is_on = True
         card.icon_widget = circle.icon_widget
+        card.svg_path = svg_path
         card.circle_frame = circle
         card.text_label = text
-        card.glow_effect = glow
         
         return card
         
@@ -278,18 +430,12 @@ class MainWindow(QMainWindow):
         circle = QFrame()
         circle.setObjectName("iconCircle")
         circle.setFixedSize(50, 50)
-        circle.setStyleSheet(f"""
-            QFrame#iconCircle {{
-                background: transparent;
-                border: 3px solid {StyleConstants.CYAN_BRIGHT};
-                border-radius: 25px;
-            }}
-        """)
-        
-        icon = QSvgWidget(svg_path)
+        
+        icon = QLabel()
         icon.setFixedSize(30, 30)
-        icon.setStyleSheet("background: transparent;")
-        icon.original_svg_path = svg_path
+        icon.setPixmap(
+            _render_svg(svg_path, StyleConstants.CYAN_BRIGHT, icon.devicePixelRatioF())
+        )
         
         circle_layout = QVBoxLayout(circle)
         circle_layout.setContentsMargins(0, 0, 0, 0)
@@ -298,11 +444,9 @@ class MainWindow(QMainWindow):
         circle.icon_widget = icon
         return circle
         
-    def _make_video_card(self, title: str, video_path: str = None) -> QFrame:
+    def _make_video_card(self, title: str, video_path: str = None) -> QWidget:
         """Create a video display card"""
-        card = QFrame()
-        card.setObjectName("videoCard")
-        card.setStyleSheet("QFrame#videoCard { background: transparent; border: none; }")
+        card = QWidget()
         card.setMinimumHeight(120)
         card.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
@@ -328,19 +472,6 @@ class MainWindow(QMainWindow):
         """Create video card header"""
         header = QFrame()
         header.setObjectName("videoHeader")
-        header.setStyleSheet(f"""
-            QFrame#videoHeader {{
-                background: {StyleConstants.BLUE_PRIMARY};
-                border: 1px solid {StyleConstants.BLUE_DARK};
-                border-radius: 6px;
-            }}
-            QLabel {{
-                color: #ffffff;
-                font-weight: 600;
-                font-size: 13px;
-                background: transparent;
-            }}
-        """)
         header.setFixedHeight(StyleConstants.VIDEO_HEADER_HEIGHT)
         
         h_layout = QVBoxLayout(header)
@@ -353,16 +484,9 @@ class MainWindow(QMainWindow):
         
         return header
         
-    def _create_video_body(self, video_path: str, card: QFrame) -> QFrame:
+    def _create_video_body(self, video_path: str, card: QWidget) -> QFrame:
         """Create video display body"""
-        body = QFrame()
-        body.setObjectName("videoBody")
-        body.setStyleSheet("""
-            QFrame#videoBody {
-                background:#000000;
-                border-radius:10px;
-            }
-        """)
+        body = FastFrame("#000000")
         
         layout = QVBoxLayout(body)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -374,27 +498,24 @@ class MainWindow(QMainWindow):
         else:
             placeholder = QLabel("No video source")
             placeholder.setAlignment(Qt.AlignCenter)
-            placeholder.setStyleSheet(f"color:{StyleConstants.GRAY_MED};")
+            placeholder.setObjectName("videoPlaceholder")
             layout.addWidget(placeholder)
             
         return body
         
-    def _create_video_player(self, video_path: str, card: QFrame) -> QVideoWidget:
+    def _create_video_player(self, video_path: str, card: QWidget) -> QVideoWidget:
         """Create and configure video player"""
         video_widget = QVideoWidget()
-        video_widget.setStyleSheet("background:#000000;")
+        video_widget.setObjectName("videoWidget")
         
+        # No audio output: the UI never plays sound, so skip the audio pipeline
         player = QMediaPlayer()
-        audio_output = QAudioOutput()
-        player.setAudioOutput(audio_output)
         player.setVideoOutput(video_widget)
         player.setSource(QUrl.fromLocalFile(video_path))
         player.setLoops(QMediaPlayer.Loops.Infinite)
-        player.play()
         
         # Store references to prevent garbage collection
         card.player = player
-        card.audio_output = audio_output
         
         return video_widget
         
@@ -403,31 +524,7 @@ class MainWindow(QMainWindow):
         btn = QPushButton(text)
         btn.setCheckable(True)
         btn.setChecked(True)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {StyleConstants.BG_CARD};
-                color: {StyleConstants.GRAY_MED};
-                border: 1px solid {StyleConstants.BORDER_DARK};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 13px;
-            }}
-            QPushButton:checked {{
-                background: {StyleConstants.BLUE_PRIMARY};
-                color: #ffffff;
-                border: 1px solid {StyleConstants.BLUE_DARK};
-            }}
-            QPushButton:hover {{
-                background: #253240;
-            }}
-            QPushButton:checked:hover {{
-                background: {StyleConstants.BLUE_DARK};
-            }}
-            QPushButton:pressed {{
-                background: #1e293b;
-            }}
-        """)
+        btn.setObjectName("videoToggle")
         return btn
         
     def _update_video_visibility(self):
@@ -436,89 +533,98 @@ class MainWindow(QMainWindow):
         v2 = self.btn_v2.isChecked()
         v3 = self.btn_v3.isChecked()
         
-        self.video1.setVisible(v1)
-        self.video2.setVisible(v2)
-        self.video3.setVisible(v3)
-        self.right_split.setVisible(v2 or v3)
-        
-        # Adjust splitter sizes
-        if v1 and (v2 or v3):
-            self.content_split.setSizes([2, 1])
-        elif v1:
-            self.content_split.setSizes([1, 0])
-        elif v2 or v3:
-            self.content_split.setSizes([0, 1])
-        else:
-            self.content_split.setSizes([1, 1])
+        # Batch all visibility and stretch changes into one relayout/repaint
+        self.setUpdatesEnabled(False)
+        try:
+            panels = ((self.video1, v1), (self.video2, v2), (self.video3, v3))
+            for card, visible in panels:
+                card.setVisible(visible)
             
-        if v2 and v3:
-            self.right_split.setSizes([1, 1])
-        elif v2:
-            self.right_split.setSizes([1, 0])
-        elif v3:
-            self.right_split.setSizes([0, 1])
+                # Stop decoding streams that are not on screen. Starting is
+                # queued so backend start-up runs after the current event
+                # (window construction or the toggle click) has finished.
+                player = getattr(card, "player", None)
+                if player is not None:
+                    if visible:
+                        QTimer.singleShot(0, player.play)
+                    else:
+                        player.pause()
+            self.right_panel.setVisible(v2 or v3)
             
+            # Hidden panels get no share of the space
+            self.content_grid.setColumnStretch(0, 2 if v1 else 0)
+            self.content_grid.setColumnStretch(1, 1 if v2 or v3 else 0)
+            self.right_grid.setRowStretch(0, 1 if v2 else 0)
+            self.right_grid.setRowStretch(1, 1 if v3 else 0)
+        finally:
+            self.setUpdatesEnabled(True)
+        
     def _set_indicator_state(self, card: QFrame, is_on: bool):
         """Update indicator visual state"""
-        card.is_on = is_on
-        color = StyleConstants.CYAN_BRIGHT if is_on else StyleConstants.GRAY_DARKER
-        text_color = StyleConstants.CYAN_LIGHT if is_on else StyleConstants.GRAY_DARK
-        blur = 24 if is_on else 0
-        
-        card.setStyleSheet(f"""
-            QFrame#indicatorCard {{
-                background-color: {StyleConstants.BG_DARK};
-                border: 4px solid {color};
-                border-radius: 18px;
-            }}
-        """)
-        
-        card.circle_frame.setStyleSheet(f"""
-            QFrame#iconCircle {{
-                background: transparent;
-                border: 3px solid {color};
-                border-radius: 25px;
-            }}
-        """)
-        
-        self._recolor_svg(card.icon_widget, color)
-        card.text_label.setStyleSheet(f"color:{text_color}; font-weight:600;")
-        card.glow_effect.setColor(QColor(color if is_on else "#1a1e23"))
-        card.glow_effect.setBlurRadius(blur)
-        
-    def _recolor_svg(self, svg_widget: QSvgWidget, color: str):
-        """Dynamically recolor SVG icon"""
-        if not hasattr(svg_widget, 'original_svg_path'):
-            return
-            
-        svg_path = svg_widget.original_svg_path
-        if not os.path.exists(svg_path):
+        if card.is_on == is_on:
             return
-            
-        with open(svg_path, 'r') as f:
-            svg_content = f.read()
-            
-        svg_content = re.sub(r'fill="[^"]*"', f'fill="{color}"', svg_content)
-        svg_content = re.sub(r'stroke="[^"]*"', f'stroke="{color}"', svg_content)
-        svg_widget.load(svg_content.encode())
+        card.is_on = is_on
+        card.setStyleSheet(_CARD_QSS_ON if is_on else _CARD_QSS_OFF)
+        self._refresh_indicator_icon(card)
+        
+    def _refresh_indicator_icon(self, card: QFrame):
+        """Show the icon pixmap for the card's state at its current pixel ratio"""
+        color = StyleConstants.CYAN_BRIGHT if card.is_on else StyleConstants.GRAY_DARKER
+        icon = card.icon_widget
+        icon.setPixmap(_render_svg(card.svg_path, color, icon.devicePixelRatioF()))
         
     def _update_indicator_states(self):
         """Randomly update indicator states (simulated)"""
-        self._set_indicator_state(self.lamp_card, bool(random.randint(0, 1)))
-        self._set_indicator_state(self.speaker_card, bool(random.randint(0, 1)))
-        self._set_indicator_state(self.buzzer_card, bool(random.randint(0, 1)))
-        
-    def _start_indicator_timer(self):
-        """Start periodic indicator updates"""
-        self.indicator_timer = QTimer()
+        bits = random.getrandbits(3)
+        self._pending_states = (bool(bits & 1), bool(bits & 2), bool(bits & 4))
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+            
+    def _apply_indicator_states(self):
+        """Apply the latest pending indicator states, once per frame at most"""
+        if self._pending_states is None:
+            return
+        cards = (self.lamp_card, self.speaker_card, self.buzzer_card)
+        for card, new_state in zip(cards, self._pending_states):
+            self._set_indicator_state(card, new_state)
+        self._pending_states = None
+        
+    def _setup_indicator_timers(self):
+        """Create indicator timers; polling only runs while the window is shown"""
+        self.indicator_timer = QTimer(self)
+        self.indicator_timer.setInterval(1000)
         self.indicator_timer.timeout.connect(self._update_indicator_states)
-        self.indicator_timer.start(1000)
+        
+        # Batch state changes arriving within one frame into a single repaint
+        self._pending_states = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(16)
+        self._coalesce_timer.timeout.connect(self._apply_indicator_states)
+        
+    def event(self, event):
+        """Re-render indicator icons when the window's pixel ratio changes"""
+        if event.type() in (QEvent.DevicePixelRatioChange, QEvent.ScreenChangeInternal):
+            for card in (self.lamp_card, self.speaker_card, self.buzzer_card):
+                self._refresh_indicator_icon(card)
+        return super().event(event)
+        
+    def showEvent(self, event):
+        """Resume indicator polling when the window is shown"""
+        super().showEvent(event)
+        self.indicator_timer.start()
+        
+    def hideEvent(self, event):
+        """Pause indicator polling while the window is hidden or minimized"""
+        super().hideEvent(event)
+        self.indicator_timer.stop()
 
 
 def main():
     """Application entry point"""
     import sys
     app = QApplication(sys.argv)
+    app.setStyleSheet(_GLOBAL_QSS)
     window = MainWindow()
     sys.exit(app.exec())
 